@@ -9,86 +9,422 @@
 
 __version__ = '0.9.3'
 
-import iland
 import argparse
-import logging
 import json
 import time
 import sys
 import datetime
+import hashlib
+import os
+import calendar
+import urllib.parse
+import functools
+import shlex
+import csv
+import io
+import tempfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import iland
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+INVENTORY_TTL = 60
+MAX_WORKERS = 8
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'ilandinfo')
+
+# Map the object types used in the CLI to the API entity labels.
+_ENTITY_LOOKUP = {
+    'catalog'         : 'IAAS_CATALOG',
+    'company'         : 'COMPANY',
+    'edge'            : 'IAAS_EDGE',
+    'location'        : 'IAAS_LOCATION',
+    'media'           : 'IAAS_MEDIA',
+    'network'         : 'IAAS_INTERNAL_NETWORK',
+    'o365-job'        : 'O365_JOB',
+    'o365-location'   : 'O365_LOCATION',
+    'o365-org'        : 'O365_ORGANIZATION',
+    'o365-restore'    : 'O365_RESTORE_SESSION',
+    'org'             : 'IAAS_ORGANIZATION',
+    'template'        : 'IAAS_VAPP_TEMPLATE',
+    'vdc'             : 'IAAS_VDC',
+    'vapp'            : 'IAAS_VAPP',
+    'vapp-network'    : 'IAAS_VAPP_NETWORK',
+    'backup-location' : 'VCC_BACKUP_LOCATION',
+    'backup-tenant'   : 'VCC_BACKUP_TENANT',
+    'vpg'             : 'IAAS_VPG',
+    'vm'              : 'IAAS_VM'
+}
+
+# Parsed credentials files keyed by (path, st_mtime_ns).
+_CREDENTIALS_CACHE = {}
+# Marks a Report whose raw body has not been decoded yet; None is a valid decoded value.
+_UNPARSED = object()
+
+def json_loads(data):
+    """Decode JSON text or bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumpb(data, pretty: bool = True) -> bytes:
+    """Encode data as UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson:
+        if pretty:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        return orjson.dumps(data)
+    return json_dumps(data, pretty).encode()
+
+def json_dumps(data, pretty: bool = True) -> str:
+    """Encode data as JSON, using orjson when it is installed.
+
+    Pretty output is sorted and indented, otherwise the output is compact.
+    """
+    if orjson:
+        return json_dumpb(data, pretty).decode()
+    if pretty:
+        return json.dumps(data, sort_keys=True, indent=2)
+    return json.dumps(data, separators=(',', ':'))
+
+def path_segment(value: str) -> str:
+    """Percent-encode a value for use as a single segment of an API path."""
+    return urllib.parse.quote(str(value), safe='')
+
+def get_output_file(file=None):
+    """Return file, or the binary buffer behind stdout when file is None."""
+    if file is None:
+        # Push out any text already written through sys.stdout first.
+        sys.stdout.flush()
+        file = sys.stdout.buffer
+    return file
+
+def write_json(data, file=None) -> None:
+    """Write data as JSON bytes and a newline without building an intermediate str.
+
+    file defaults to the binary buffer behind stdout. Output is pretty-printed
+    only when file is a terminal.
+    """
+    file = get_output_file(file)
+    file.write(json_dumpb(data, pretty=file.isatty()))
+    file.write(b'\n')
 
 class Inventory:
+    __slots__ = ('company_id', 'company_name', 'entities')
+
     def __init__(self, data: dict):
         self.company_id = data['company_id']
         self.company_name = data['company_name']
         self.entities = data['entities']
 
-    def __str__(self):
-        data = {
+    def _as_dict(self) -> dict:
+        return {
             'company_id'  : self.company_id,
             'company_name': self.company_name,
             'entities'    : self.entities
         }
-        return json.dumps(data, sort_keys=True, indent=2)
+
+    def __str__(self):
+        return json_dumps(self._as_dict())
+
+    def dump(self, file=None) -> None:
+        """Write the inventory as JSON to file, stdout by default."""
+        write_json(self._as_dict(), file)
 
     def get_entity(self, object: str):
-        """Convert the object type used in the CLI to the API entity label."""
-        items = []
-        entity_lookup = {
-            'catalog'         : 'IAAS_CATALOG',
-            'company'         : 'COMPANY',
-            'edge'            : 'IAAS_EDGE',
-            'location'        : 'IAAS_LOCATION',
-            'media'           : 'IAAS_MEDIA',
-            'network'         : 'IAAS_INTERNAL_NETWORK',
-            'o365-job'        : 'O365_JOB',
-            'o365-location'   : 'O365_LOCATION',
-            'o365-org'        : 'O365_ORGANIZATION',
-            'o365-restore'    : 'O365_RESTORE_SESSION',
-            'org'             : 'IAAS_ORGANIZATION',
-            'template'        : 'IAAS_VAPP_TEMPLATE',
-            'vdc'             : 'IAAS_VDC',
-            'vapp'            : 'IAAS_VAPP',
-            'vapp-network'    : 'IAAS_VAPP_NETWORK',
-            'backup-location' : 'VCC_BACKUP_LOCATION',
-            'backup-tenant'   : 'VCC_BACKUP_TENANT',
-            'vpg'             : 'IAAS_VPG',
-            'vm'              : 'IAAS_VM'
-        }
+        """Return the inventory items for the object type used in the CLI.
 
-        api_entity = entity_lookup[object]
-        for item in self.entities[api_entity]:
-            items.append(item)
-        return items
+        The list is shared with the inventory; copy it before modifying it.
+        """
+        return self.entities.get(_ENTITY_LOOKUP[object], [])
 
-    def csv_list_object(self, object: str):
-        """Print out a CSV style inventory list of the object type specified."""
-        entity_list = self.get_entity(object)
-        print('Name, UUID')
-        for item in entity_list:
-            print(f"{item['name']}, {item['uuid']}")
+    def csv_list_object(self, object: str, quote: bool = False):
+        """Print out a CSV style inventory list of the object type specified.
+
+        With quote, the list is written by csv.writer so names containing
+        commas or quotes are escaped.
+        """
+        if quote:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            writer.writerow(('Name', 'UUID'))
+            writer.writerows((item['name'], item['uuid']) for item in self.get_entity(object))
+            sys.stdout.write(buffer.getvalue())
+            return
+
+        rows = [f"{item['name']}, {item['uuid']}\n" for item in self.get_entity(object)]
+        sys.stdout.write('Name, UUID\n' + ''.join(rows))
+
+    def csv_list_objects(self, objects: list, quote: bool = False):
+        """Print out one CSV style inventory list covering several object types.
+
+        A single object type prints the same list as csv_list_object. Several
+        types share one header and a leading Type column names each row's type.
+        """
+        objects = list(dict.fromkeys(objects))
+        if len(objects) == 1:
+            self.csv_list_object(objects[0], quote)
+            return
+
+        if quote:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            writer.writerow(('Type', 'Name', 'UUID'))
+            for object in objects:
+                writer.writerows((object, item['name'], item['uuid']) for item in self.get_entity(object))
+            sys.stdout.write(buffer.getvalue())
+            return
+
+        rows = [
+            f"{object}, {item['name']}, {item['uuid']}\n"
+            for object in objects
+            for item in self.get_entity(object)
+        ]
+        sys.stdout.write('Type, Name, UUID\n' + ''.join(rows))
 
 class Report:
-    def __init__(self, data: dict):
-        if 'data' in data:
-            self.data = data['data']
-        else:
-            self.data = data
+    __slots__ = ('_data', '_raw')
+
+    def __init__(self, data: dict, unwrap: bool = True):
+        self._data = self._unwrap(data) if unwrap else data
+        self._raw = None
+
+    @staticmethod
+    def _unwrap(data):
+        """Strip the API's {"data": ...} envelope, if there is one."""
+        if isinstance(data, dict) and 'data' in data:
+            return data['data']
+        return data
+
+    @classmethod
+    def from_raw(cls, raw: bytes) -> 'Report':
+        """Build a report from an undecoded response body, parsed on first use of data."""
+        report = cls.__new__(cls)
+        report._data = _UNPARSED
+        report._raw = raw
+        return report
+
+    @property
+    def data(self):
+        if self._data is _UNPARSED:
+            self._data = self._unwrap(json_loads(self._raw))
+        return self._data
 
     def __str__(self):
-        return json.dumps(self.data, sort_keys=True, indent=2)
+        """Pretty-print for a terminal, emit compact JSON when piped."""
+        return json_dumps(self.data, pretty=sys.stdout.isatty())
 
     def __repr__(self):
-        return self.data
+        return repr(self.data)
+
+    def dump(self, file=None) -> None:
+        """Write the report as JSON to file, stdout by default.
+
+        Output is pretty-printed for a terminal and compact otherwise.
+        """
+        write_json(self.data, get_output_file(file))
+
+class CachedApi:
+    """Wrap iland.Api and revalidate GET responses against an on-disk cache.
+
+    The last body for each resource path is stored together with its ETag and
+    Last-Modified headers. Later requests send If-None-Match/If-Modified-Since
+    and a 304 Not Modified response is answered from the stored body. When the
+    server has no ETag and ignores If-Modified-Since, a HEAD request is used to
+    compare Last-Modified before downloading the body again.
+
+    Entries are never pruned; delete the cache directory to reclaim the space.
+    A cache_dir of None turns the on-disk cache off.
+    """
+    __slots__ = ('api', 'username', 'cache_dir')
+
+    def __init__(self, api: 'iland.Api', username: str, cache_dir: str = CACHE_DIR):
+        import requests
+
+        self.api = api
+        self.username = username
+        self.cache_dir = cache_dir
+
+        # iland.Api already keeps a requests.Session; size its API host pool so
+        # every get_many worker can hold a kept-alive connection.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+        self.api._session.mount(self.api._base_url, adapter)
+
+    def _cache_paths(self, rpath: str) -> tuple:
+        """Return the body and meta file paths used to cache rpath."""
+        if self.cache_dir is None:
+            return None, None
+        key = hashlib.sha1(f"{self.username}:{self.api._base_url}{rpath}".encode()).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.meta"
+
+    def _load_meta(self, meta_path: str) -> dict:
+        if meta_path is None:
+            return {}
+        try:
+            with open(meta_path, 'r') as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if not os.path.exists(meta.get('body_path', '')):
+            return {}
+        return meta
+
+    def _save(self, body_path: str, meta_path: str, meta: dict, body: bytes) -> None:
+        """Write the body and meta files, replacing any previous entry atomically.
+
+        Cached responses hold billing and inventory data, so the directory is
+        private to the user (0700) and the files are created 0600.
+        """
+        if body_path is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            for path, content in ((body_path, body), (meta_path, json.dumps(meta).encode())):
+                # A unique temporary file keeps concurrent CLI runs from clobbering each other.
+                descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_dir)
+                try:
+                    with os.fdopen(descriptor, 'wb') as file:
+                        file.write(content)
+                    os.replace(temporary_path, path)
+                except OSError:
+                    os.unlink(temporary_path)
+                    raise
+        except OSError:
+            # The cache is an optimization only; never fail a command over it.
+            pass
+
+    def _request(self, method: str, rpath: str, headers: dict):
+        """Issue a request on the iland.Api session."""
+        return self.api._session.request(
+            method,
+            self.api._base_url + rpath,
+            headers=headers,
+            verify=self.api._verify_ssl,
+            proxies=self.api._proxies
+        )
+
+    def close(self) -> None:
+        """Release the pooled connections held by the iland.Api session."""
+        self.api._session.close()
+
+    def login(self) -> None:
+        """Obtain or refresh the access token before requests are issued concurrently."""
+        self.api.refresh_access_token()
+
+    def get(self, rpath: str) -> dict:
+        """Perform a conditional GET against the iland cloud API and decode the body."""
+        return json_loads(self.get_raw(rpath))
+
+    def get_raw(self, rpath: str) -> bytes:
+        """Perform a conditional GET against the iland cloud API.
+
+        Returns the undecoded response body; error responses raise ApiException.
+        """
+        import iland
+
+        body_path, meta_path = self._cache_paths(rpath)
+        meta = self._load_meta(meta_path)
+
+        self.api.refresh_access_token()
+        headers = {
+            'Authorization': f"Bearer {self.api.get_access_token()['access_token']}",
+            'Accept': 'application/vnd.ilandcloud.api.v1.0+json'
+        }
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        if meta.get('head_check'):
+            response = self._request('HEAD', rpath, headers)
+            if response.status_code == 304 or (
+                response.status_code == 200
+                and response.headers.get('Last-Modified') == meta['last_modified']
+            ):
+                with open(meta['body_path'], 'rb') as file:
+                    return file.read()
+
+        response = self._request('GET', rpath, headers)
+
+        if response.status_code == 304 and meta:
+            with open(meta['body_path'], 'rb') as file:
+                return file.read()
+
+        if response.status_code not in [200, 201, 202, 204]:
+            try:
+                error = json_loads(response.content)
+            except ValueError:
+                error = response.content
+            raise iland.ApiException(error)
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            meta = {
+                'etag'         : etag,
+                'last_modified': last_modified,
+                'body_path'    : body_path,
+                # A full body with an unchanged Last-Modified means the server
+                # ignored If-Modified-Since, so check with HEAD from now on. Once
+                # learned the flag is kept, even when the resource has changed.
+                'head_check'   : not etag and (
+                    meta.get('head_check') or last_modified == headers.get('If-Modified-Since')
+                )
+            }
+            self._save(body_path, meta_path, meta, response.content)
+
+        return response.content
 
 class Client:
-    def __init__(self, credentials: dict):
+    __slots__ = ('username', '_credentials', '_cache_dir', '_api', '_inventory', '_inventory_expires')
+
+    def __init__(self, credentials: dict, cache_dir: str = CACHE_DIR):
         self.username = credentials['username']
-        self.api = iland.Api(**credentials)
+        self._credentials = credentials
+        self._cache_dir = cache_dir
+        self._api = None
+        self._inventory = None
+        self._inventory_expires = 0.0
+
+    @property
+    def api(self) -> CachedApi:
+        """Create the API connection on first use."""
+        if self._api is None:
+            # iland pulls in requests and urllib3; only import it once the API is needed.
+            import iland
+            import logging
+
+            # Set iland logger level to WARNING to reduce noise
+            iland.log.LOG.setLevel(logging.WARNING)
+            self._api = CachedApi(iland.Api(**self._credentials), self.username, self._cache_dir)
+        return self._api
+
+    def close(self) -> None:
+        """Close the API connection if one was opened."""
+        if self._api is not None:
+            self._api.close()
+            self._api = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def get_inventory(self, company: str) -> Inventory:
-        """Return the inventory object for the user specified in the credentials file."""
-        inventory = self.api.get(f"/users/{self.username}/inventory")['inventory']
+        """Return the inventory object for the user specified in the credentials file.
+
+        The user inventory is fetched once and reused for INVENTORY_TTL seconds.
+        """
+        if self._inventory is None or time.monotonic() >= self._inventory_expires:
+            self._inventory = self.api.get(f"/users/{self.username}/inventory")['inventory']
+            self._inventory_expires = time.monotonic() + INVENTORY_TTL
+        inventory = self._inventory
 
         if not company:
             selected_inventory = inventory[0]
@@ -100,13 +436,37 @@ class Client:
 
         return Inventory(selected_inventory)
 
+    def invalidate_inventory(self) -> None:
+        """Drop the memoized inventory so the next get_inventory fetches it again."""
+        self._inventory = None
+        self._inventory_expires = 0.0
+
+    def get_many(self, function, uuids: list, *args) -> Report:
+        """Run a per-UUID report function for each UUID concurrently.
+
+        A single UUID returns its report unchanged, several UUIDs return one
+        report keyed by UUID.
+        """
+        if len(uuids) == 1:
+            return function(uuids[0], *args)
+
+        # concurrent.futures imports logging and threading; only load it for a fan-out.
+        import concurrent.futures
+
+        # Authenticate once up front so the workers don't race for a token.
+        self.api.login()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            reports = executor.map(lambda uuid: function(uuid, *args), uuids)
+            # Keyed by UUID, so a UUID named "data" must not be taken for the envelope.
+            return Report({uuid: report.data for uuid, report in zip(uuids, reports)}, unwrap=False)
+
     def get_org_billing_summary(self, uuid: str) -> Report:
         """Returns previous month, current month, previous hour, and current hour billing
 
         Example from iland console:
         https://console.ilandcloud.com/api/v1/orgs/{uuid}/billing-summary
         """
-        return Report(self.api.get(f"/orgs/{uuid}/billing-summary"))
+        return Report.from_raw(self.api.get_raw(f"/orgs/{path_segment(uuid)}/billing-summary"))
 
     def get_org_billing(self, uuid: str, date: datetime.date) -> Report:
         """Returns current billing information
@@ -114,15 +474,15 @@ class Client:
         Example from iland console:
         https://console.ilandcloud.com/api/v1/orgs/{uuid}/billing
         """
-        parameters = f"year={date.year}&month={date.month}"
-        return Report(self.api.get(f"/orgs/{uuid}/billing?{parameters}"))
+        parameters = urllib.parse.urlencode({'year': date.year, 'month': date.month})
+        return Report.from_raw(self.api.get_raw(f"/orgs/{path_segment(uuid)}/billing?{parameters}"))
 
     def get_org_billing_by_vdc(self, uuid: str) -> Report:
         """Returns billing information by VDC
         
         No example use discovered in the iland console.
         """
-        return Report(self.api.get(f"/orgs/{uuid}/billing-by-vdc"))
+        return Report.from_raw(self.api.get_raw(f"/orgs/{path_segment(uuid)}/billing-by-vdc"))
 
     def get_org_billing_historical(self, uuid: str, start: datetime.date, end: datetime.date) -> Report:
         """Returns a series of historical monthly org costs
@@ -130,10 +490,10 @@ class Client:
         The console pulls the last 5 months to use in the montly bar graph on the billing tab:
         https://console.ilandcloud.com/api/v1/orgs/{uuid}/historical-billing?start=1624027630654&end=1637250430654
         """
-        start_timestamp = int(time.mktime(start.timetuple())) * 1000
-        end_timestamp = int(time.mktime(end.timetuple())) * 1000
-        parameters = f"start={start_timestamp}&end={end_timestamp}"
-        return Report(self.api.get(f"/orgs/{uuid}/historical-billing?{parameters}"))
+        start_timestamp = epoch_milliseconds(start)
+        end_timestamp = epoch_milliseconds(end)
+        parameters = urllib.parse.urlencode({'start': start_timestamp, 'end': end_timestamp})
+        return Report.from_raw(self.api.get_raw(f"/orgs/{path_segment(uuid)}/historical-billing?{parameters}"))
 
     def get_org_billing_historical_vdc(self, uuid: str, start: datetime.date, end: datetime.date) -> Report:
         """Returns the historical billing data by VDC
@@ -141,8 +501,13 @@ class Client:
         The console uses historical-billing-by-vdc to build the historical billing bar graphs.
         https://console.ilandcloud.com/api/v1/orgs/{uuid}/historical-billing-by-vdc?startMonth=7&startYear=2021&endMonth=11&endYear=2021
         """
-        parameters = f"startYear={start.year}&startMonth={start.month}&endYear={end.year}&endMonth={end.month}"
-        return Report(self.api.get(f"/orgs/{uuid}/historical-billing-by-vdc?{parameters}"))
+        parameters = urllib.parse.urlencode({
+            'startYear' : start.year,
+            'startMonth': start.month,
+            'endYear'   : end.year,
+            'endMonth'  : end.month
+        })
+        return Report.from_raw(self.api.get_raw(f"/orgs/{path_segment(uuid)}/historical-billing-by-vdc?{parameters}"))
 
     def get_o365_billing(self, company: str, location: str, start: datetime.date, end: datetime.date) -> Report:
         """Returns the O365 billing for a location
@@ -153,19 +518,19 @@ class Client:
         Console example:
         https://console.ilandcloud.com/api/v1/companies/{company}/location/lon02.ilandcloud.com/o365-billing?startYear=2021&startMonth=9&endYear=2021&endMonth=11
         """
-        parameter_list = []
+        parameter_dict = {}
 
         if start:
-            parameter_list.append(f"startYear={start.year}&startMonth={start.month}")
+            parameter_dict.update(startYear=start.year, startMonth=start.month)
         if end:
-            parameter_list.append(f"endYear={end.year}&endMonth={end.month}")
+            parameter_dict.update(endYear=end.year, endMonth=end.month)
 
-        parameters = "&".join(parameter_list)
+        parameters = urllib.parse.urlencode(parameter_dict)
 
         if parameters:
-            return Report(self.api.get(f"/companies/{company}/location/{location}/o365-billing?{parameters}"))
+            return Report.from_raw(self.api.get_raw(f"/companies/{path_segment(company)}/location/{path_segment(location)}/o365-billing?{parameters}"))
         else:
-            return Report(self.api.get(f"/companies/{company}/location/{location}/o365-billing"))
+            return Report.from_raw(self.api.get_raw(f"/companies/{path_segment(company)}/location/{path_segment(location)}/o365-billing"))
 
     def get_backup_tenants_billing(self, company: str, location: str, start: datetime.date, end: datetime.date) -> Report:
         """Returns the VCC Backup Tenants Billing report for a company
@@ -176,29 +541,30 @@ class Client:
         Console example:
         https://console.ilandcloud.com/api/v1/companies/{company}/vcc-backup-tenants-billing?location=dal02.ilandcloud.com&startYear=2021&startMonth=7&endYear=2021&endMonth=12
         """
-        parameter_list = []
+        parameter_dict = {}
 
         if location:
-            parameter_list.append(f"location={location}")
+            parameter_dict['location'] = location
         if start:
-            parameter_list.append(f"startYear={start.year}&startMonth={start.month}")
+            parameter_dict.update(startYear=start.year, startMonth=start.month)
         if end:
-            parameter_list.append(f"endYear={end.year}&endMonth={end.month}")
+            parameter_dict.update(endYear=end.year, endMonth=end.month)
 
-        parameters = "&".join(parameter_list)
+        parameters = urllib.parse.urlencode(parameter_dict)
 
         if parameters:
-            return Report(self.api.get(f"/companies/{company}/vcc-backup-tenants-billing?{parameters}"))
+            return Report.from_raw(self.api.get_raw(f"/companies/{path_segment(company)}/vcc-backup-tenants-billing?{parameters}"))
         else:
-            return Report(self.api.get(f"/companies/{company}/vcc-backup-tenants-billing"))
+            return Report.from_raw(self.api.get_raw(f"/companies/{path_segment(company)}/vcc-backup-tenants-billing"))
 
 
     # vdcs-cost-over-invoice-period ? year, month
     # Returns a time series (1 hour increments) of VDCs sum costs for the VDC Cost Accrual Breakdown graph
     # https://console.ilandcloud.com/api/v1/orgs/{uuid}/vdcs-cost-over-invoice-period?year={YYYY}&month={MM}
 
-def get_args() -> argparse.Namespace:
-    """ Setup the argument parser and parse the arguments.
+@functools.lru_cache(maxsize=1)
+def get_parser() -> argparse.ArgumentParser:
+    """ Setup the argument parser once and reuse it for later calls.
 
         ilandinfo inventory <object>
         ilandinfo billing <service>
@@ -214,6 +580,11 @@ def get_args() -> argparse.Namespace:
         default='creds.json',
         help='Credentials file (JSON format)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f"Do not read or write the response cache in {CACHE_DIR}"
+    )
 
     subparsers = parser.add_subparsers(
         dest='command',
@@ -225,25 +596,21 @@ def get_args() -> argparse.Namespace:
     )
     inventory_parser.add_argument(
         'object',
-        choices=[
-            'backup-location',
-            'backup-tenant',
-            'company',
-            'location',
-            'o365-org',
-            'org',
-            'vapp',
-            'vdc',
-            'vm'
-        ],
-        default=None,
-        help='Type of object to list'
+        nargs='+',
+        choices=sorted(_ENTITY_LOOKUP),
+        metavar='object',
+        help=f"Type of object to list (one or more of: {', '.join(sorted(_ENTITY_LOOKUP))})"
     )
     inventory_parser.add_argument(
         '--company',
         type=str,
         help='company number'
     )
+    inventory_parser.add_argument(
+        '--quote',
+        action='store_true',
+        help='write standard CSV, quoting names that contain commas'
+    )
 
     billing_parser = subparsers.add_parser(
         'billing',
@@ -268,7 +635,7 @@ def get_args() -> argparse.Namespace:
     billing_parser.add_argument(
         '--uuid',
         type=str,
-        help='service UUID to report on'
+        help='service UUID to report on, separate multiple UUIDs with commas'
     )
     billing_parser.add_argument(
         '--start',
@@ -296,97 +663,195 @@ def get_args() -> argparse.Namespace:
         help='location in LLL##.ilandcloud.com format'
     )
 
-    return parser.parse_args()
+    shell_parser = subparsers.add_parser(
+        'shell',
+        help='Run several inventory and billing commands with one API session',
+        description='Run inventory and billing commands, one per line, against a single login. '
+                    'The credentials file and --no-cache are chosen when the shell starts and '
+                    'are rejected on shell lines.'
+    )
+    shell_parser.add_argument(
+        '--script',
+        type=str,
+        help='file with one command per line, "-" for stdin (default: interactive prompt)'
+    )
+
+    return parser
+
+def get_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    return get_parser().parse_args()
 
 def get_credentials(credentials_file: str) -> dict:
-    """Open the JSON format credentials file and import the credentials."""
-    with open(credentials_file, 'r') as file:
-        credentials = json.load(file)
+    """Open the JSON format credentials file and import the credentials.
+
+    Parsed credentials are reused until the file's modification time changes.
+    """
+    key = (credentials_file, os.stat(credentials_file).st_mtime_ns)
+    credentials = _CREDENTIALS_CACHE.get(key)
+    if credentials is None:
+        with open(credentials_file, 'rb') as file:
+            credentials = json_loads(file.read())
+        _CREDENTIALS_CACHE[key] = credentials
     return credentials
 
+@functools.lru_cache(maxsize=64)
 def parse_date(date_string: str) -> datetime.date:
     """Take a string with the format YYYY-MM-DD and return a datetime.date"""
-    try:
-        date = datetime.date.fromisoformat(date_string)
-    except ValueError:
-        sys.exit('Incorrect date format. Correct format is YYYY-MM-DD.\n  \
-            YYYY is the four-digit year.\n  \
-            MM is the two-digit month.\n  \
-            DD is the two-digit day.')
+    if len(date_string) == 10 and date_string[4] == '-' == date_string[7]:
+        try:
+            return datetime.date.fromisoformat(date_string)
+        except ValueError:
+            pass
+
+    sys.exit('Incorrect date format. Correct format is YYYY-MM-DD.\n'
+             '  YYYY is the four-digit year.\n'
+             '  MM is the two-digit month.\n'
+             '  DD is the two-digit day.')
 
-    return date
+def epoch_milliseconds(date: datetime.date) -> int:
+    """Return midnight UTC of date as milliseconds since the Unix epoch."""
+    return calendar.timegm(date.timetuple()) * 1000
 
 def check_required_arguments(args: argparse.Namespace, *arguments) -> None:
     """Send an error if required optional arguments are not provided."""
-    missing_arguments = []
-    for argument in arguments:
-        if not vars(args)[argument]:
-            missing_arguments.append(f"--{argument}")
+    missing_arguments = [f"--{argument}" for argument in arguments if not getattr(args, argument, None)]
 
     if missing_arguments:
-        sys.exit(f'Missing arguments. {args.command} {args.service} requires: {" ,".join(missing_arguments)}')
-
-def main() -> None:
-    args = get_args()
-    credentials = get_credentials(args.credentials_file)
-    client = Client(credentials)
-
-    # Set iland logger level to WARNING to reduce noise
-    iland.log.LOG.setLevel(logging.WARNING)
-
+        sys.exit(f'Missing arguments. {args.command} {args.service} requires: {", ".join(missing_arguments)}')
+
+def read_commands(script: str):
+    """Yield command lines from a script file, stdin, or an interactive prompt."""
+    if script and script != '-':
+        with open(script, 'r') as file:
+            yield from file
+    elif script == '-' or not sys.stdin.isatty():
+        yield from sys.stdin
+    else:
+        while True:
+            try:
+                yield input('ilandinfo> ')
+            except KeyboardInterrupt:
+                # Like a shell prompt, Ctrl-C discards the current line.
+                print()
+            except EOFError:
+                print()
+                return
+
+def run_shell(client: Client, script: str) -> None:
+    """Run commands against one Client so the session and inventory are reused.
+
+    Errors in one command are reported on stderr and the shell moves on to the
+    next command.
+    """
+    import iland
+
+    parser = get_parser()
+    for line in read_commands(script):
+        try:
+            words = shlex.split(line, comments=True)
+        except ValueError as error:
+            print(f"Could not parse command: {error}", file=sys.stderr)
+            continue
+        if not words:
+            continue
+        if words[0] in ('exit', 'quit'):
+            break
+
+        try:
+            # Pre-set the client options so argparse leaves them None unless the line sets them.
+            args = parser.parse_args(words, namespace=argparse.Namespace(credentials_file=None, no_cache=None))
+            if args.credentials_file is not None or args.no_cache is not None:
+                sys.exit('--credentials-file and --no-cache must be given before "shell"; the shell keeps one client.')
+            if args.command == 'shell':
+                sys.exit('shell can not be nested.')
+            run_command(client, args)
+        except SystemExit as error:
+            # argparse and check_required_arguments exit on bad input; keep the shell running.
+            if isinstance(error.code, str):
+                print(error.code, file=sys.stderr)
+        except iland.ApiException as error:
+            print(f"API error: {error}", file=sys.stderr)
+        except KeyboardInterrupt:
+            print('Interrupted.', file=sys.stderr)
+
+def parse_optional_date(date_string: str) -> datetime.date:
+    """Parse date_string with parse_date, or return None if it was not given."""
+    if date_string:
+        return parse_date(date_string)
+    return None
+
+def split_uuids(uuid_string: str) -> list:
+    """Split a comma-separated --uuid value, dropping blanks and duplicates."""
+    uuids = list(dict.fromkeys(uuid.strip() for uuid in uuid_string.split(',') if uuid.strip()))
+    if not uuids:
+        sys.exit('Missing arguments. --uuid requires at least one UUID.')
+    return uuids
+
+def billing_org(client: Client, args: argparse.Namespace) -> Report:
+    date = parse_optional_date(args.date) or datetime.date.today()
+    return client.get_many(client.get_org_billing, split_uuids(args.uuid), date)
+
+def billing_org_by_vdc(client: Client, args: argparse.Namespace) -> Report:
+    return client.get_many(client.get_org_billing_by_vdc, split_uuids(args.uuid))
+
+def billing_org_summary(client: Client, args: argparse.Namespace) -> Report:
+    return client.get_many(client.get_org_billing_summary, split_uuids(args.uuid))
+
+def billing_org_historical(client: Client, args: argparse.Namespace) -> Report:
+    start = parse_date(args.start)
+    end = parse_date(args.end)
+    return client.get_many(client.get_org_billing_historical, split_uuids(args.uuid), start, end)
+
+def billing_org_historical_by_vdc(client: Client, args: argparse.Namespace) -> Report:
+    start = parse_date(args.start)
+    end = parse_date(args.end)
+    return client.get_many(client.get_org_billing_historical_vdc, split_uuids(args.uuid), start, end)
+
+def billing_o365(client: Client, args: argparse.Namespace) -> Report:
+    start = parse_optional_date(args.start)
+    end = parse_optional_date(args.end)
+    return client.get_o365_billing(args.company, args.location, start, end)
+
+def billing_backup(client: Client, args: argparse.Namespace) -> Report:
+    start = parse_optional_date(args.start)
+    end = parse_optional_date(args.end)
+    return client.get_backup_tenants_billing(args.company, args.location, start, end)
+
+# Billing services: (required arguments, handler returning the Report).
+BILLING_SERVICES = {
+    'backup'               : (('company',), billing_backup),
+    'o365'                 : (('company', 'location'), billing_o365),
+    'org'                  : (('uuid',), billing_org),
+    'org-by-vdc'           : (('uuid',), billing_org_by_vdc),
+    'org-summary'          : (('uuid',), billing_org_summary),
+    'org-historical'       : (('uuid', 'start', 'end'), billing_org_historical),
+    'org-historical-by-vdc': (('uuid', 'start', 'end'), billing_org_historical_by_vdc)
+}
+
+def run_command(client: Client, args: argparse.Namespace) -> None:
+    """Run a single inventory or billing command."""
     if args.command == 'inventory':
         inventory = client.get_inventory(args.company)
-        inventory.csv_list_object(args.object)
+        inventory.csv_list_objects(args.object, args.quote)
 
     if args.command == 'billing':
-        if args.service == 'org':
-            check_required_arguments('uuid')
-            if args.date:
-                date = parse_date(args.date)
-            else:
-                date = datetime.date.today()
-            report = client.get_org_billing(args.uuid, date)
-        elif args.service == 'org-by-vdc':
-            check_required_arguments(args, 'uuid')
-            report = client.get_org_billing_by_vdc(args.uuid)
-        elif args.service == 'org-summary':
-            check_required_arguments(args, 'uuid')
-            report = client.get_org_billing_summary(args.uuid)
-        elif args.service == 'org-historical':
-            check_required_arguments(args, 'start', 'end')
-            start = parse_date(args.start)
-            end = parse_date(args.end)
-            report = client.get_org_billing_historical(args.uuid, start, end)
-
-        elif args.service == 'org-historical-by-vdc':
-            check_required_arguments(args, 'start', 'end')
-            start = parse_date(args.start)
-            end = parse_date(args.end)
-            report = client.get_org_billing_historical_vdc(args.uuid, start, end)
-        elif args.service == 'o365':
-            check_required_arguments(args, 'company', 'location')
-            start = None
-            end = None
-
-            if args.start:
-                start = parse_date(args.start)
-            if args.end:
-                end = parse_date(args.end)
-
-            report = client.get_o365_billing(args.company, args.location, start, end)
-        elif args.service == 'backup':
-            check_required_arguments(args, 'company')
-            start = None
-            end = None
-
-            if args.start:
-                start = parse_date(args.start)
-            if args.end:
-                end = parse_date(args.end)
-
-            report = client.get_backup_tenants_billing(args.company, args.location, start, end)
-
-        print(report)
+        if args.service not in BILLING_SERVICES:
+            sys.exit(f"billing {args.service} is not implemented yet.")
+
+        required_arguments, handler = BILLING_SERVICES[args.service]
+        check_required_arguments(args, *required_arguments)
+        handler(client, args).dump()
+
+def main() -> None:
+    args = get_args()
+    credentials = get_credentials(args.credentials_file)
+    cache_dir = None if args.no_cache else CACHE_DIR
+    with Client(credentials, cache_dir) as client:
+        if args.command == 'shell':
+            run_shell(client, args.script)
+        else:
+            run_command(client, args)
 
 if __name__ == '__main__':
     main()